@@ -5,6 +5,8 @@ Manages parallel scan execution with priority queue and group-based dispatching.
 
 import argparse
 import os
+import subprocess
+import sys
 
 
 class ScanQueueManager:
@@ -33,6 +35,7 @@ class ScanQueueManager:
     def __init__(self):
         self.high_priority = []  # User-triggered scans
         self.normal_priority = []  # Scheduled scans
+        self.running = []  # Dispatched scan processes
     
     def get_scan_params_for_group(self, group: int) -> dict:
         """Get scan parameters for a specific group"""
@@ -40,6 +43,22 @@ class ScanQueueManager:
             return {}
         return self.SCAN_GROUPS[group]
     
+    def get_single_pass_args(self, group: int, index: int = 12) -> list:
+        """Arguments of one pkscreener run screening every stock of an index with all scanners of a group's s2 list"""
+        params = self.get_scan_params_for_group(group)
+        scans = [scan for scan in params.get("s2", "").split(",") if scan.isdigit()]
+        if not scans:
+            return []
+        return ["-a", "Y", "-e", "-o", f"F:{index}", "--scans", ",".join(scans)]
+    
+    def queue_single_pass(self, group: int, high_priority: bool = False) -> bool:
+        """Queue the single pass run of a group instead of one run per scanner"""
+        scan = self.get_single_pass_args(group)
+        if not scan:
+            return False
+        (self.high_priority if high_priority else self.normal_priority).append(scan)
+        return True
+    
     def dispatch_parallel(self, max_concurrent: int = 4):
         """Dispatch up to max_concurrent scans in parallel"""
         dispatched = 0
@@ -47,26 +66,34 @@ class ScanQueueManager:
         # Process high priority first
         while self.high_priority and dispatched < max_concurrent:
             scan = self.high_priority.pop(0)
-            self._dispatch_scan(scan)
+            self.running.append(self._dispatch_scan(scan))
             dispatched += 1
         
         # Then normal priority
         while self.normal_priority and dispatched < max_concurrent:
             scan = self.normal_priority.pop(0)
-            self._dispatch_scan(scan)
+            self.running.append(self._dispatch_scan(scan))
             dispatched += 1
         
         return dispatched
     
+    def wait(self) -> int:
+        """Wait for the dispatched scans to finish, returns the first non-zero exit code (or 0)"""
+        codes = [process.wait() for process in self.running]
+        self.running = []
+        return next((code for code in codes if code != 0), 0)
+    
     def _dispatch_scan(self, scan):
-        """Dispatch a single scan"""
-        print(f"Dispatching scan: {scan}")
+        """Dispatch a single scan: runs pkscreener with the scan's arguments"""
+        print(f"Dispatching scan: pkscreener {' '.join(scan)}")
+        return subprocess.Popen([sys.executable, os.path.join("pkscreener", "pkscreenercli.py"), *scan])
 
 
 def main():
     parser = argparse.ArgumentParser(description="Scan Queue Manager")
     parser.add_argument("--group", type=int, help="Scan group to process (1-4)")
     parser.add_argument("--list-groups", action="store_true", help="List all scan groups")
+    parser.add_argument("--dispatch", action="store_true", help="Run the single pass scan of the group")
     args = parser.parse_args()
     
     manager = ScanQueueManager()
@@ -80,6 +107,10 @@ def main():
             print(f"Group {args.group} parameters:")
             for key, value in params.items():
                 print(f"  -{key}: {value}")
+            print(f"Single pass: pkscreener {' '.join(manager.get_single_pass_args(args.group))}")
+            if args.dispatch and manager.queue_single_pass(args.group):
+                manager.dispatch_parallel(max_concurrent=1)
+                sys.exit(manager.wait())
         else:
             print(f"Unknown group: {args.group}")
 
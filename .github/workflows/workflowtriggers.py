@@ -590,6 +590,16 @@ def cleanuphistoricalscans(scanDaysInPast=450):
     if removedFileCount > 0:
         tryCommitOutcomes(options, pathSpec=None, delete=True)
 
+def singlePassScans():
+    # Scanners without sub-menus (X_<index>_<scan>) of the same index, which can
+    # run in a single pass over the data as F:<index> --scans <scan>,<scan>,...
+    groups = {}
+    for key in objectDictionary.keys():
+        parts = objectDictionary[key]["td3"].split("_")
+        if len(parts) == 3 and parts[0] == "X" and parts[2].isnumeric():
+            groups.setdefault(parts[1], []).append((key, parts[2]))
+    return {indexOption: scans for indexOption, scans in groups.items() if len(scans) > 1}
+
 def triggerScanWorkflowActions(launchLocal=False, scanDaysInPast=0):
     # original_stdout = sys.stdout
     # original__stdout = sys.__stdout__
@@ -613,7 +623,17 @@ def triggerScanWorkflowActions(launchLocal=False, scanDaysInPast=0):
             os.remove(os.path.join(os.getcwd(),f"pkscreener{os.sep}.env.dev"))
         except:
             pass
+    singlePassGroups = {} if launchLocal else singlePassScans()
+    singlePassKeys = [key for scans in singlePassGroups.values() for key, _ in scans]
+    for indexOption, scans in singlePassGroups.items():
+        # One run screens every stock with all these scanners and still
+        # sends the results of each scanner on their own.
+        resp = triggerRemoteScanAlertWorkflow(f"F:{indexOption} --scans {','.join(scan for _, scan in scans)}", branch)
+        if resp.status_code == 204:
+            sleep(5)
     for key in objectDictionary.keys():
+        if key in singlePassKeys:
+            continue
         scanOptions = f'{objectDictionary[key]["td3"]}_D_D_D_D_D'
         options = f'{scanOptions.replace("_",":").replace("B:","X:")}:D:D:D'.replace("::",":")
         if launchLocal: